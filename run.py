@@ -14,8 +14,48 @@ import json
 import csv
 import os
 import sys
-import subprocess
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+
+# Use orjson for faster JSON output when available, fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Horizontal whitespace: any Unicode whitespace (including the NBSPs in the
+# scraped text) except newline
+_WS = r'[^\S\n]'
+
+# Single precompiled pattern for parse_lqk_file, run with finditer over the
+# whole file: one alternative per line type (car header, section/row/space,
+# available date), dispatched on which group matched. Lines that match none of
+# them are skipped without building per-line strings. "Section:" and
+# "Available:" are only recognised at the start of a line (as in LQK.txt).
+# Groups: 1-3 year/make/model, 4-6 section/row/space, 7 available.
+_LINE_RE = re.compile(
+    f'(?m)^{_WS}*(?:'
+    f'(\\d{{4}}){_WS}+([^ \\n]+){_WS}+(.+?){_WS}+available for parts'
+    f'|Section:{_WS}*(.+?){_WS}+Row:{_WS}*(.+?){_WS}+Space:{_WS}*(.+)'
+    f'|Available:{_WS}+(.+))'
+)
+
+# ============================================================================
+# DATA MODEL
+# ============================================================================
+
+@dataclass(slots=True)
+class Car:
+    """A single car entry (serialized to site/cars.json)"""
+    year: str
+    make: str
+    model: str
+    location: str = ''
+    available: str = ''
 
 # ============================================================================
 # PARSING FUNCTIONS
@@ -25,50 +65,49 @@ def parse_lqk_file(input_file):
     """Parse LQK.txt and return list of car entries"""
 
     cars = []
-    current_car = {}
+    current_car = None
 
-    if not os.path.exists(input_file):
+    try:
+        with open(input_file, 'r', encoding='utf-8') as f:
+            text = f.read()
+    except FileNotFoundError:
         print(f"  Warning: {input_file} not found")
         return []
 
-    with open(input_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-
-            # Match car info line: "YEAR MAKE MODEL available for parts YEAR MAKE MODEL"
-            car_match = re.match(r'^(\d{4})\s+([^ ]+)\s+(.+?)\s+available for parts', line)
-            if car_match:
-                # Save previous car if exists
-                if current_car and 'year' in current_car:
-                    cars.append(current_car)
-
-                # Start new car entry
-                year = car_match.group(1)
-                make = car_match.group(2)
-                model = car_match.group(3).strip()
-                current_car = {
-                    'year': year,
-                    'make': make,
-                    'model': model,
-                    'location': '',
-                    'available': ''
-                }
-
-            # Match section/row/space line
-            section_match = re.search(r'Section:\s*(.+?)\s+Row:\s*(.+?)\s+Space:\s*(.+)', line)
-            if section_match and current_car:
-                section = section_match.group(1).strip()
-                row = section_match.group(2).strip()
-                space = section_match.group(3).strip()
-                current_car['location'] = f"{section} {row} {space}".strip()
-
-            # Match available date line
-            date_match = re.search(r'Available:\s+(.+)', line)
-            if date_match and current_car:
-                current_car['available'] = date_match.group(1).strip()
+    # Bind hot-loop attribute lookups to locals
+    cars_append = cars.append
+
+    for m in _LINE_RE.finditer(text):
+        # Car info line: "YEAR MAKE MODEL available for parts YEAR MAKE MODEL"
+        if m.group(3) is not None:
+            # Save previous car if exists
+            if current_car is not None:
+                cars_append(current_car)
+
+            # Start new car entry
+            current_car = Car(
+                year=m.group(1),
+                make=m.group(2),
+                model=m.group(3).strip()
+            )
+
+        # Section/row/space line: "Section: X    Row: Y    Space: Z"
+        # (a line with nothing after "Space:" but whitespace is ignored)
+        elif m.group(6) is not None:
+            space = m.group(6).strip()
+            if space and current_car is not None:
+                section = m.group(4).strip()
+                row = m.group(5).strip()
+                current_car.location = f"{section} {row} {space}".strip()
+
+        # Available date line (ignored if the date is only whitespace)
+        elif m.group(7) is not None:
+            available = m.group(7).strip()
+            if available and current_car is not None:
+                current_car.available = available
 
     # Don't forget the last car
-    if current_car and 'year' in current_car:
+    if current_car is not None:
         cars.append(current_car)
 
     return cars
@@ -78,29 +117,42 @@ def parse_csv_file(csv_file):
 
     cars = []
 
-    if not os.path.exists(csv_file):
-        print(f"  Warning: {csv_file} not found")
-        return []
-
     try:
         with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+
+            # Resolve column positions from the header once
+            header = next(reader, None)
+            if header is None:
+                return cars
+            columns = {name: i for i, name in enumerate(header)}
+            year_i, car_i, loc_i, date_i = (columns.get(name) for name in ('year', 'car', 'location', 'date'))
+
+            def field(row, i):
+                return row[i].strip() if i is not None and i < len(row) else ''
 
             for row in reader:
+                # Skip blank lines (as DictReader does)
+                if not row:
+                    continue
+
                 # Parse car name into make and model
-                car_name = row.get('car', '').strip()
+                car_name = field(row, car_i)
                 parts = car_name.split(' ', 1)
 
                 make = parts[0] if parts else ''
                 model = parts[1] if len(parts) > 1 else ''
 
-                cars.append({
-                    'year': row.get('year', '').strip(),
-                    'make': make,
-                    'model': model,
-                    'location': row.get('location', '').strip(),
-                    'available': row.get('date', '').strip()
-                })
+                cars.append(Car(
+                    year=field(row, year_i),
+                    make=make,
+                    model=model,
+                    location=field(row, loc_i),
+                    available=field(row, date_i)
+                ))
+    except FileNotFoundError:
+        print(f"  Warning: {csv_file} not found")
+        return []
     except Exception as e:
         print(f"  Error parsing {csv_file}: {e}")
 
@@ -113,48 +165,35 @@ def parse_csv_file(csv_file):
 def remove_duplicates(cars):
     """Remove duplicate entries based on year, make, model (merges different locations)"""
 
-    # Group by year, make, model only
-    car_groups = {}
+    # Single pass: keep only the newest entry per year, make, model
+    best = {}
 
     for car in cars:
         # Create key by car type only (not location or date)
-        key = (car['year'], car['make'], car['model'])
-
-        if key not in car_groups:
-            car_groups[key] = []
-
-        car_groups[key].append(car)
+        key = (car.year, car.make, car.model)
+        date = parse_date(car.available)
 
-    # For each group, keep only the one with the most recent date
-    unique_cars = []
-    duplicates_removed = 0
-
-    for key, group in car_groups.items():
-        if len(group) == 1:
-            unique_cars.append(group[0])
-        else:
-            # Multiple entries for same car type - keep the one with newest date
-            duplicates_removed += len(group) - 1
-
-            # Sort by date and keep the newest
-            group_sorted = sorted(group, key=lambda x: parse_date(x['available']), reverse=True)
-            unique_cars.append(group_sorted[0])
+        prev = best.get(key)
+        if prev is None or date > prev[0]:
+            best[key] = (date, car)
 
+    duplicates_removed = len(cars) - len(best)
     print(f"  Removed {duplicates_removed} duplicate entries")
 
-    return unique_cars
+    return [car for _, car in best.values()]
 
 # ============================================================================
 # DATA CONVERSION
 # ============================================================================
 
+@lru_cache(maxsize=None)
 def parse_date(date_str):
-    """Parse date string for sorting"""
+    """Parse date string into a packed YYYYMMDD int for sorting (memoized, dates repeat across entries)"""
     parts = date_str.split('/')
     if len(parts) == 3:
         month, day, year = map(int, parts)
-        return (year, month, day)
-    return (0, 0, 0)
+        return year * 10000 + month * 100 + day
+    return 0
 
 def convert_to_site_format(cars):
     """Convert car data to site format and sort by date"""
@@ -163,64 +202,52 @@ def convert_to_site_format(cars):
     cars = remove_duplicates(cars)
 
     # Sort by available date (newest first)
-    cars_sorted = sorted(cars, key=lambda x: parse_date(x['available']), reverse=True)
+    cars_sorted = sorted(cars, key=lambda x: parse_date(x.available), reverse=True)
 
     return cars_sorted
 
 def save_to_json(data, output_file):
-    """Save data to JSON file"""
+    """Save data to JSON file (uses orjson's C serializer when available)"""
+
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
 
     with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+        json.dump(data, f, indent=2, ensure_ascii=False, default=asdict)
+
+def _format_numbered(items):
+    """Format items as "(1) a, (2) b, ..." """
+    if len(items) == 1:
+        return f"(1) {items[0]}"
+    return ", ".join(f"({i}) {item}" for i, item in enumerate(items, 1))
 
 def save_to_lqk_consolidated(data, output_file):
     """Save data to LQK.json in consolidated format"""
 
-    # Group by car (make + model) and year
-    car_groups = {}
-
-    for car in data:
-        car_name = f"{car['make']} {car['model']}"
-        year = car['year']
-        key = (car_name, year)
-
-        if key not in car_groups:
-            car_groups[key] = {'dates': [], 'locations': []}
-
-        car_groups[key]['dates'].append(car['available'])
-        car_groups[key]['locations'].append(car['location'])
+    # Group by car (make + model) and year: sort once on the key (stable, so
+    # each group keeps input order) and walk the groups with groupby
+    keyed = sorted((((f"{car.make} {car.model}", car.year), car) for car in data), key=itemgetter(0))
 
     # Convert to consolidated format
     consolidated = []
-    for (car_name, year), data in sorted(car_groups.items()):
-        # Get unique dates and locations (keeping first occurrence order)
-        unique_dates = []
-        seen_dates = set()
-        for date in data['dates']:
-            if date not in seen_dates:
-                unique_dates.append(date)
-                seen_dates.add(date)
-
-        unique_locations = []
-        seen_locations = set()
-        for loc in data['locations']:
-            if loc not in seen_locations:
-                unique_locations.append(loc)
-                seen_locations.add(loc)
-
-        # Format dates string with counts
-        date_count = len(unique_dates)
-        if date_count == 1:
-            dates_str = f"(1) {unique_dates[0]}"
+    for (car_name, year), group in groupby(keyed, key=itemgetter(0)):
+        cars = [car for _, car in group]
+
+        # Get unique dates and locations (keeping first occurrence order);
+        # most cars have a single observation, so skip deduplicating those
+        if len(cars) == 1:
+            unique_dates = [cars[0].available]
+            unique_locations = [cars[0].location]
         else:
-            dates_str = ", ".join([f"({i+1}) {date}" for i, date in enumerate(unique_dates)])
+            unique_dates = list(dict.fromkeys(car.available for car in cars))
+            unique_locations = list(dict.fromkeys(car.location for car in cars))
 
-        # Format locations string with counts
-        loc_count = len(unique_locations)
-        if loc_count == 1:
-            locations_str = f"(1) {unique_locations[0]}"
-        else:
-            locations_str = ", ".join([f"({i+1}) {loc}" for i, loc in enumerate(unique_locations)])
+        # Format dates and locations strings with counts
+        date_count = len(unique_dates)
+        dates_str = _format_numbered(unique_dates)
+        locations_str = _format_numbered(unique_locations)
 
         consolidated.append({
             'car': car_name,
@@ -234,8 +261,7 @@ def save_to_lqk_consolidated(data, output_file):
     consolidated.sort(key=lambda x: (x['car'], x['year']))
 
     # Save to JSON
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(consolidated, f, indent=2)
+    save_to_json(consolidated, output_file)
 
 # ============================================================================
 # SERVER FUNCTIONS
@@ -256,8 +282,13 @@ def start_server(port=8001):
         print(f"Open: http://localhost:{port}/")
         print("\nPress Ctrl+C to stop the server")
 
-        os.chdir(site_dir)
-        subprocess.run(['python3', '-m', 'http.server', str(port)])
+        # Imported here so runs that don't serve the site don't pay for it
+        from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+        # Serve in-process; threaded so concurrent asset fetches don't serialize
+        handler = partial(SimpleHTTPRequestHandler, directory=str(site_dir))
+        with ThreadingHTTPServer(('', port), handler) as httpd:
+            httpd.serve_forever()
 
     except KeyboardInterrupt:
         print("\nServer stopped.")
@@ -315,16 +346,17 @@ def main():
 
     # Show date range
     if cars_final:
-        dates = [car['available'] for car in cars_final if car.get('available')]
-        if dates:
-            dates_sorted = sorted(dates, key=parse_date, reverse=True)
-            print(f"  Date range: {dates_sorted[-1]} to {dates_sorted[0]}")
+        # cars_final is already sorted newest first
+        newest = next((car.available for car in cars_final if car.available), None)
+        if newest:
+            oldest = next(car.available for car in reversed(cars_final) if car.available)
+            print(f"  Date range: {oldest} to {newest}")
 
         # Show some examples
         print("\n  Newest 5 entries:")
         for i, car in enumerate(cars_final[:5], 1):
-            loc = car.get('location', 'N/A')[:35]
-            print(f"    {i}. {car['year']} {car['make']} {car['model']} - {car['available']} - {loc}")
+            loc = car.location[:35]
+            print(f"    {i}. {car.year} {car.make} {car.model} - {car.available} - {loc}")
 
     # Step 4: Save files
     print(f"\n[4/4] Saving files...")
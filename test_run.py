@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Tests for LQK.txt parsing in run.py"""
+
+import os
+import tempfile
+import unittest
+
+import run
+
+
+class ParseLqkFileTest(unittest.TestCase):
+
+    def parse(self, text):
+        fd, path = tempfile.mkstemp(suffix='.txt')
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        return run.parse_lqk_file(path)
+
+    def test_nbsp_separated_header(self):
+        # Scraped pages use NBSPs between fields
+        cars = self.parse(
+            "2006\xa0CHEVROLET\xa0MALIBU available for parts X\n"
+            "Section: TRUCKS \xa0\xa0 Row: 2 \xa0\xa0 Space: 12\n"
+            "Available: 2/4/2026\n"
+        )
+        self.assertEqual(cars, [run.Car(year='2006', make='CHEVROLET', model='MALIBU',
+                                        location='TRUCKS 2 12', available='2/4/2026')])
+
+    def test_empty_space_leaves_location_unset(self):
+        cars = self.parse(
+            "2009 NISSAN MURANO available for parts 2009 NISSAN MURANO\n"
+            "Section: A Row: 2 Space:\n"
+        )
+        self.assertEqual(cars[0].location, '')
+
+    def test_trailing_whitespace_after_empty_fields(self):
+        for newline in ('\n', '\r\n'):
+            for trailing in ('', '   '):
+                with self.subTest(newline=newline, trailing=trailing):
+                    cars = self.parse(newline.join([
+                        "2009 NISSAN MURANO available for parts 2009 NISSAN MURANO",
+                        "Available: 2/4/2026",
+                        "Section: A Row: 2 Space:" + trailing,
+                        "Available:  " + trailing,
+                        "",
+                    ]))
+                    self.assertEqual(cars[0].location, '')
+                    self.assertEqual(cars[0].available, '2/4/2026')
+
+    def test_crlf_line_endings(self):
+        cars = self.parse(
+            "2009 NISSAN MURANO available for parts 2009 NISSAN MURANO\r\n"
+            "Section: TRUCKS    Row: 2    Space: 11\r\n"
+            "Available: 2/4/2026\r\n"
+        )
+        self.assertEqual(cars[0].location, 'TRUCKS 2 11')
+        self.assertEqual(cars[0].available, '2/4/2026')
+
+    def test_section_and_available_only_at_line_start(self):
+        cars = self.parse(
+            "2009 NISSAN MURANO available for parts X Available: 1/2/2026\n"
+            "> Section: A Row: 2 Space: 3\n"
+        )
+        self.assertEqual(cars[0].location, '')
+        self.assertEqual(cars[0].available, '')
+
+
+if __name__ == '__main__':
+    unittest.main()